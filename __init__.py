@@ -8,9 +8,19 @@ bl_info = {
     "category": "3D View",
 }
 
-import bpy, os, platform, subprocess, shutil, time
+import bpy, functools, logging, os, platform, subprocess, shutil, time
+from bpy.app.handlers import persistent
 from datetime import datetime
 
+_SYSTEM = platform.system()
+
+# Messages are formatted lazily, only if a handler consumes them. No handler is
+# attached: warnings/errors still reach stderr via logging.lastResort, but INFO
+# (export path, launch command) is dropped unless the user configures logging.
+# Failures therefore log the command / files themselves at WARNING or above.
+log = logging.getLogger("CuraBridge")
+log.setLevel(logging.INFO)
+
 # -----------------------------------------------------------------------------#
 #  Preferences                                                                 #
 # -----------------------------------------------------------------------------#
@@ -18,11 +28,10 @@ class CuraBridgePreferences(bpy.types.AddonPreferences):
     bl_idname = __name__
 
     def _update_tab(self, ctx):
-        bpy.utils.unregister_class(CURA_PT_panel)
-        CURA_PT_panel.bl_category = self.tab_name
-        bpy.utils.register_class(CURA_PT_panel)
-
+        _schedule_tab(self.tab_name)
 
+    def _update_export_dir(self, ctx):
+        _chosen_dir.cache_clear()
 
     cura_path: bpy.props.StringProperty(
         name="Cura Executable",
@@ -44,7 +53,8 @@ class CuraBridgePreferences(bpy.types.AddonPreferences):
         name        = "Export Directory",
         subtype     = 'DIR_PATH',
         description = "Directory where STLs are exported to",
-        default     = ""
+        default     = "",
+        update      = _update_export_dir
     )
 
     def draw(self, _):
@@ -56,6 +66,9 @@ class CuraBridgePreferences(bpy.types.AddonPreferences):
 # -----------------------------------------------------------------------------#
 #  Scene-level export settings                                                 #
 # -----------------------------------------------------------------------------#
+_AXIS_ITEMS = (('X','+X',''), ('Y','+Y',''), ('Z','+Z',''),
+               ('NEGATIVE_X','-X',''), ('NEGATIVE_Y','-Y',''), ('NEGATIVE_Z','-Z',''))
+
 class CuraExportProps(bpy.types.PropertyGroup):
     scale: bpy.props.FloatProperty(
         name        = "Scale",
@@ -78,18 +91,22 @@ class CuraExportProps(bpy.types.PropertyGroup):
         description = "Apply scene unit scaling (cm / mm).",
         default     = True
     )
+    one_file_per_object: bpy.props.BoolProperty(
+        name        = "One File per Object",
+        description = "Export each selected mesh to its own STL (single exporter call) "
+                      "and open them all in Cura together.",
+        default     = False
+    )
     axis_forward: bpy.props.EnumProperty(
         name        = "Forward Axis",
         description = "Forward axis in exported coordinates.",
-        items = [('X','+X',''), ('Y','+Y',''), ('Z','+Z',''),
-                 ('NEGATIVE_X','-X',''), ('NEGATIVE_Y','-Y',''), ('NEGATIVE_Z','-Z','')],
+        items       = _AXIS_ITEMS,
         default = 'Y'
     )
     axis_up: bpy.props.EnumProperty(
         name        = "Up Axis",
         description = "Up axis in exported coordinates.",
-        items = [('X','+X',''), ('Y','+Y',''), ('Z','+Z',''),
-                 ('NEGATIVE_X','-X',''), ('NEGATIVE_Y','-Y',''), ('NEGATIVE_Z','-Z','')],
+        items       = _AXIS_ITEMS,
         default = 'Z'
     )
 
@@ -99,6 +116,7 @@ class CuraExportProps(bpy.types.PropertyGroup):
 HOME                = os.path.expanduser("~")
 DEFAULT_EXPORT_DIR  = os.path.join(HOME, "Downloads", "CuraBridge")
 
+@functools.lru_cache(maxsize=1)
 def _chosen_dir() -> str:
     prefs = bpy.context.preferences.addons[__name__].preferences
     if prefs.export_dir.strip():
@@ -106,23 +124,45 @@ def _chosen_dir() -> str:
     return DEFAULT_EXPORT_DIR
 
 def _wipe_export_dir(path: str) -> None:
-    # Remove every file + the folder (ignore errors)
-    if os.path.isdir(path):
-        shutil.rmtree(path, ignore_errors=True)
+    # Remove every file + the folder (ignore errors, incl. a missing folder)
+    shutil.rmtree(path, ignore_errors=True)
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str):
+    # Full path of a launcher on PATH (or None); cleared on unregister
+    return shutil.which(name)
 
 def _ensure_export_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
-def _make_stl_path(obj) -> str:
-    directory = _chosen_dir()
+def _make_stl_path(obj, directory:str) -> str:
     _ensure_export_dir(directory)
     if bpy.data.filepath:
         base = os.path.splitext(os.path.basename(bpy.data.filepath))[0]
         return os.path.join(directory, f"{base}.stl")
     safe = bpy.path.clean_name(obj.name)
-    ts   = datetime.now().strftime("%Y%m%d_%H%M%S")
+    n    = datetime.now()
+    ts   = f"{n.year:04d}{n.month:02d}{n.day:02d}_{n.hour:02d}{n.minute:02d}{n.second:02d}"
     return os.path.join(directory, f"{safe}_{ts}.stl")
 
+def _staging_dir(directory:str) -> str:
+    # Fresh scratch folder the exporter writes into before files go live
+    staging = os.path.join(directory, ".part")
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging, exist_ok=True)
+    return staging
+
+def _publish_stls(staging:str, directory:str) -> list:
+    # Atomically rename finished STLs into `directory` so Cura never sees a partial file
+    paths = []
+    with os.scandir(staging) as it:
+        for e in it:
+            if e.name.lower().endswith(".stl") and e.is_file():
+                dst = os.path.join(directory, e.name)
+                os.replace(e.path, dst)
+                paths.append(dst)
+    return sorted(paths)
+
 # -----------------------------------------------------------------------------#
 #  Operator – export & launch Cura                                             #
 # -----------------------------------------------------------------------------#
@@ -133,78 +173,165 @@ class CURA_OT_send(bpy.types.Operator):
                       "and open in Cura.  Export folder is cleaned on Blender "
                       "start / exit.")
 
+    LAUNCH_GRACE = 2.0   # s a launcher must stay alive (or exit 0) to count as started
+
+    _timer    = None
+    _proc     = None
+    _started  = 0.0
+    _cmd      = ()
+    _cmds     = ()
+    _stlpaths = ()
+
     @staticmethod
-    def _launch(cmd:list) -> bool:
-        print("[CuraBridge]", " ".join(cmd))
+    def _launch(cmd:list):
+        log.info("Launch: %s", cmd)
         try:
-            p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            time.sleep(1)
-            if p.poll() is not None:  # If exited early, return as False
-                out, err = p.communicate()
-                print(out.decode()); print(err.decode())
-                return False
-            return True
+            # Fully detach Cura: no undrained pipes, own session / process group
+            kw = dict(stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=True)
+            if _SYSTEM == "Windows":
+                kw["creationflags"] = (subprocess.CREATE_NEW_PROCESS_GROUP |
+                                       subprocess.DETACHED_PROCESS)
+            else:
+                kw["start_new_session"] = True
+            return subprocess.Popen(cmd, **kw)
         except Exception as e:
-            print("[CuraBridge] launch error:", e)
-            return False
+            log.error("launch error for %s: %s", cmd, e)
+            return None
+
+    @staticmethod
+    def _launch_cmds(prefs, stlpaths:list) -> list:
+        # Candidate launchers, most specific first
+        cmds = []
+        if prefs.cura_path and os.path.isfile(prefs.cura_path):
+            cmds.append([prefs.cura_path, *stlpaths])
+
+        if os.environ.get("FLATPAK_ID") and _which("flatpak-spawn"):
+            cmds.append([_which("flatpak-spawn"), "--host", f"--directory={HOME}",
+                         "flatpak", "run", "com.ultimaker.cura", *stlpaths])
+
+        if _SYSTEM == "Linux":
+            if _which("cura"):
+                cmds.append([_which("cura"), *stlpaths])
+            elif _which("flatpak"):
+                cmds.append([_which("flatpak"), "run", "com.ultimaker.cura", *stlpaths])
+        elif _SYSTEM == "Darwin":
+            cmds.append(["open", "-a", "Ultimaker Cura", *stlpaths])
+        return cmds
+
+    def _spawn_next(self) -> bool:
+        # Start the next candidate launcher; False once none are left
+        while self._cmds:
+            self._cmd  = self._cmds.pop(0)
+            self._proc = self._launch(self._cmd)
+            if self._proc is not None:
+                self._started = time.monotonic()
+                return True
+        self._proc = None
+        return False
+
+    def _poll_launch(self):
+        # None while still undecided, otherwise whether Cura was launched
+        rc = self._proc.poll()
+        if rc is None and time.monotonic() - self._started < self.LAUNCH_GRACE:
+            return None
+        if rc is None or rc == 0:  # still running after grace period, or clean hand-off
+            return True
+
+        log.warning("launcher exited early with code %s: %s", rc, self._cmd)
+        if self._spawn_next():
+            return None
+        return self._open_fallback()
+
+    def _open_fallback(self) -> bool:
+        if _SYSTEM == "Windows":
+            try:
+                for path in self._stlpaths: os.startfile(path)
+                return True
+            except OSError: pass
+        return False
+
+    def _finish(self, ctx, launched:bool) -> set:
+        if self._timer is not None:
+            ctx.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        if not launched:
+            log.error("could not launch Cura for %s", self._stlpaths)
+            self.report({'ERROR'}, "Could not launch Cura – see console.")
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Cura launched; STL sent.")
+        return {'FINISHED'}
 
     def execute(self, ctx):
+        prefs = ctx.preferences.addons[__name__].preferences
 
-        _wipe_export_dir(_chosen_dir())  # clean on export
+        directory = _chosen_dir()
 
-        if not any(o.type == 'MESH' for o in ctx.selected_objects):
+        mesh_objs = [o for o in ctx.selected_objects if o.type == 'MESH']
+        if not mesh_objs:
             self.report({'ERROR'}, "Select a mesh object to export.")
             return {'CANCELLED'}
+        obj = ctx.active_object if ctx.active_object in mesh_objs else mesh_objs[0]
 
         props   = ctx.scene.cura_export
-        stlpath = _make_stl_path(ctx.active_object)
-        print(f"[CuraBridge] Export -> {stlpath}")
+        stlpath = _make_stl_path(obj, directory)
+        log.info("Export -> %s", stlpath)
+
+        staging = _staging_dir(directory)
 
         try:
             bpy.ops.wm.stl_export(
-                filepath                = stlpath,
+                filepath                = os.path.join(staging, os.path.basename(stlpath)),
                 ascii_format            = props.ascii_format,
                 export_selected_objects = True,
-                use_batch               = False,
+                use_batch               = props.one_file_per_object,
                 global_scale            = props.scale,
                 apply_modifiers         = props.apply_modifiers,
                 use_scene_unit          = props.use_scene_unit,
                 forward_axis            = props.axis_forward,
                 up_axis                 = props.axis_up,
                 check_existing          = False)
+            stlpaths = _publish_stls(staging, directory)
         except Exception as e:
             self.report({'ERROR'}, f"STL export failed: {e}")
             return {'CANCELLED'}
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
 
-        prefs = ctx.preferences.addons[__name__].preferences
-        launched = False
-
-        if prefs.cura_path and os.path.isfile(prefs.cura_path):
-            launched = self._launch([prefs.cura_path, stlpath])
-
-        if not launched and os.environ.get("FLATPAK_ID") and shutil.which("flatpak-spawn"):
-            launched = self._launch(["flatpak-spawn", "--host", f"--directory={HOME}",
-                                     "flatpak", "run", "com.ultimaker.cura", stlpath])
-
-        if not launched and platform.system() == "Linux":
-            if shutil.which("cura"):
-                launched = self._launch(["cura", stlpath])
-            elif shutil.which("flatpak"):
-                launched = self._launch(["flatpak", "run", "com.ultimaker.cura", stlpath])
-
-        if not launched and platform.system() == "Windows":
-            try: os.startfile(stlpath); launched = True
-            except OSError: pass
-
-        if not launched and platform.system() == "Darwin":
-            launched = self._launch(["open", "-a", "Ultimaker Cura", stlpath])
-
-        if not launched:
-            self.report({'ERROR'}, "Could not launch Cura – see console.")
+        if not stlpaths:
+            self.report({'ERROR'}, "STL export produced no files.")
             return {'CANCELLED'}
 
-        self.report({'INFO'}, "Cura launched; STL sent.")
-        return {'FINISHED'}
+        self._stlpaths = stlpaths
+        self._cmds     = self._launch_cmds(prefs, stlpaths)
+        if not self._spawn_next():
+            return self._finish(ctx, self._open_fallback())
+
+        if ctx.window is None:  # no event loop (background / script): wait inline
+            launched = self._poll_launch()
+            while launched is None:
+                time.sleep(0.1)
+                launched = self._poll_launch()
+            return self._finish(ctx, launched)
+
+        # Watch the launcher from a modal timer instead of blocking the UI
+        wm = ctx.window_manager
+        self._timer = wm.event_timer_add(0.1, window=ctx.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, ctx, event):
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        launched = self._poll_launch()
+        if launched is None:
+            return {'PASS_THROUGH'}
+        return self._finish(ctx, launched)
+
+    def cancel(self, ctx):
+        if self._timer is not None:
+            ctx.window_manager.event_timer_remove(self._timer)
+            self._timer = None
 
 # -----------------------------------------------------------------------------#
 #  Panel – UI                                                                  #
@@ -217,14 +344,11 @@ class CURA_PT_panel(bpy.types.Panel):
     bl_category    = 'Cura'
 
     def draw(self, ctx):
-        prefs = ctx.preferences.addons[__name__].preferences
-        if self.bl_category != prefs.tab_name:
-            self.bl_category = prefs.tab_name
-
         layout = self.layout
         p = ctx.scene.cura_export
         for prop in ("scale", "ascii_format", "apply_modifiers",
-                     "use_scene_unit", "axis_forward", "axis_up"):
+                     "use_scene_unit", "axis_forward", "axis_up",
+                     "one_file_per_object"):
             layout.prop(p, prop)
         layout.operator(CURA_OT_send.bl_idname, icon='EXPORT')
 
@@ -238,49 +362,91 @@ class CURA_PT_panel(bpy.types.Panel):
 classes = (CuraBridgePreferences, CuraExportProps,
            CURA_OT_send, CURA_PT_panel)
 
-def _apply_tab():
+_LAST_TAB  = None   # tab name the panel is currently registered under
+_TAB_TIMER = None   # pending debounced _apply_tab_if_changed, if any
+_MSGBUS_OWNER = object()
+
+def _apply_tab_if_changed(name:str) -> None:
+    global _LAST_TAB, _TAB_TIMER
+    _TAB_TIMER = None
+    if not name or name == _LAST_TAB:
+        return None
     try:
-        prefs = bpy.context.preferences.addons[__name__].preferences
         bpy.utils.unregister_class(CURA_PT_panel)
-        CURA_PT_panel.bl_category = prefs.tab_name
-        print("[CuraBridge] _apply_tab(): applied", prefs.tab_name)
-    except Exception as e:
-        print("[CuraBridge] _apply_tab() error:", e)
-
+    except RuntimeError:
+        pass
+    CURA_PT_panel.bl_category = name
     try:
         bpy.utils.register_class(CURA_PT_panel)
+        _LAST_TAB = name
+        log.info("_apply_tab(): applied %s", name)
     except RuntimeError as e:
-        print("[CuraBridge] _apply_tab(): register failed:", e)
+        log.error("_apply_tab(): register failed: %s", e)
+    return None  # one-shot when run from bpy.app.timers
+
+def _schedule_tab(name:str) -> None:
+    # Debounced: re-registering the panel on every edit is expensive
+    global _TAB_TIMER
+    if _TAB_TIMER is not None and bpy.app.timers.is_registered(_TAB_TIMER):
+        bpy.app.timers.unregister(_TAB_TIMER)
+    _TAB_TIMER = functools.partial(_apply_tab_if_changed, name)
+    bpy.app.timers.register(_TAB_TIMER, first_interval=0.5)
+
+def _on_tab_msg():
+    _schedule_tab(bpy.context.preferences.addons[__name__].preferences.tab_name)
+
+def _subscribe_tab(prefs) -> None:
+    # msgbus subscriptions are dropped on file load, so this is redone from load_post
+    bpy.msgbus.clear_by_owner(_MSGBUS_OWNER)
+    bpy.msgbus.subscribe_rna(key    = prefs.path_resolve("tab_name", False),
+                             owner  = _MSGBUS_OWNER,
+                             args   = (),
+                             notify = _on_tab_msg)
+
+@persistent
+def _apply_tab(*_):
+    try:
+        prefs = bpy.context.preferences.addons[__name__].preferences
+        _apply_tab_if_changed(prefs.tab_name)
+        _subscribe_tab(prefs)
+    except Exception as e:
+        log.error("_apply_tab() error: %s", e)
 
 
 def register():
     for c in classes:
         bpy.utils.register_class(c)
     bpy.types.Scene.cura_export = bpy.props.PointerProperty(type=CuraExportProps)
-    print("[CuraBridge] register(): calling _apply_tab()")
+    log.info("register(): calling _apply_tab()")
     _apply_tab()
     try:
         bpy.app.handlers.load_post.append(_apply_tab)
-        print("[CuraBridge] register(): appended load_post handler")
+        log.info("register(): appended load_post handler")
     except Exception as e:
-        print("[CuraBridge] register(): failed to append handler:", e)
+        log.error("register(): failed to append handler: %s", e)
 
-    _wipe_export_dir(_chosen_dir()) # clean on start
-    _ensure_export_dir(_chosen_dir())
-    print("[CuraBridge] registered – export dir cleaned.")
+    d = _chosen_dir()
+    _wipe_export_dir(d) # clean on start
+    _ensure_export_dir(d)
+    log.info("registered – export dir cleaned.")
 
 def unregister():
     try:
         bpy.app.handlers.load_post.remove(_apply_tab)
-        print("[CuraBridge] unregister(): removed load_post handler")
+        log.info("unregister(): removed load_post handler")
     except Exception as e:
-        print("[CuraBridge] unregister(): failed to remove handler:", e)
+        log.error("unregister(): failed to remove handler: %s", e)
+    bpy.msgbus.clear_by_owner(_MSGBUS_OWNER)
+    if _TAB_TIMER is not None and bpy.app.timers.is_registered(_TAB_TIMER):
+        bpy.app.timers.unregister(_TAB_TIMER)
     for c in reversed(classes):
         bpy.utils.unregister_class(c)
     del bpy.types.Scene.cura_export
 
     _wipe_export_dir(_chosen_dir())
-    print("[CuraBridge] unregistered – export dir cleaned.")
+    _chosen_dir.cache_clear()
+    _which.cache_clear()
+    log.info("unregistered – export dir cleaned.")
 
 if __name__ == "__main__":
     register()
\ No newline at end of file